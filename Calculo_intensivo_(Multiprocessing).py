@@ -1,20 +1,22 @@
 import multiprocessing
+import os
 import time
 
 def calcular(numero):
-    print(f"Calculando cuadrado de {numero}")
-    time.sleep(2)
-    print(f"Resultado: {numero * numero}")
+    return numero, sum(i * i for i in range(numero))
 
 if __name__ == "__main__":
-    procesos = []
+    numeros = list(range(1_000_000, 9_000_001, 1_000_000))
+    procesos = os.cpu_count() or 1
 
-    for i in range(1, 4):
-        p = multiprocessing.Process(target=calcular, args=(i,))
-        procesos.append(p)
-        p.start()
+    print(f"Calculando suma de cuadrados para {len(numeros)} rangos con {procesos} procesos")
+    inicio = time.time()
 
-    for p in procesos:
-        p.join()
+    with multiprocessing.Pool(processes=procesos) as pool:
+        resultados = pool.map(calcular, numeros,
+                              chunksize=max(1, len(numeros) // (4 * procesos)))
 
-    print("Todos los cálculos terminaron.")
+    for numero, resultado in resultados:
+        print(f"Resultado {numero}: {resultado}")
+
+    print(f"Todos los cálculos terminaron en {time.time() - inicio:.2f} segundos.")
@@ -5,12 +5,27 @@
 Conceptos demostrados:
   • threading.Thread  → cada corredor corre en su propio hilo
   • threading.Lock    → protege el marcador de posiciones (sección crítica)
+                        (o el FastRLock de fastrlock, si está instalado)
+  • threading.Barrier → todos los corredores arrancan exactamente a la vez
   • thread.join()     → esperar a que todos crucen la meta
+
+Python sin GIL (3.13t, free-threaded):
+  El programa funciona igual con `PYTHON_GIL=0 python3.13t Corredores.py`.
+  Cada hilo solo entra una vez a la sección crítica (al cruzar la meta),
+  así que el lock casi no tiene contención aunque los hilos corran
+  realmente en paralelo.
 """
 
 import threading
 import time
 import random
+from collections import deque
+
+# Lock opcional más rápido sin contención (pip install fastrlock)
+try:
+    from fastrlock.rlock import FastRLock as _Lock
+except ImportError:
+    from threading import Lock as _Lock
 
 # ──────────────────────────────────────────
 # DATOS DE LA CARRERA
@@ -18,33 +33,45 @@ import random
 CORREDORES = ["🧍 Ana", "🧍 Luis", "🧍 Marta", "🧍 Carlos", "🧍 Sofía"]
 DISTANCIA  = 10   # pasos hasta la meta
 
-# Lista de llegadas — RECURSO COMPARTIDO entre hilos
-# Sin lock, dos hilos podrían escribir al mismo tiempo → datos corruptos
-llegadas = []
+# Llegadas — RECURSO COMPARTIDO entre hilos
+# Cada elemento es (tiempo_de_llegada, nombre).
+# deque.append es atómico, pero calcular la posición (len + 1) y registrar
+# la llegada deben ocurrir JUNTOS → eso es lo único que protege el lock.
+llegadas = deque()
+
+# 🔒 Lock: solo UN hilo a la vez puede calcular su posición y registrarse
+lock = _Lock()
 
-# 🔒 Lock: solo UN hilo a la vez puede modificar `llegadas`
-lock = threading.Lock()
+# 🚦 Barrera de salida: cada corredor espera aquí hasta que TODOS estén listos.
+# Sin ella, el primer hilo lanzado con .start() arrancaría con ventaja.
+salida = threading.Barrier(len(CORREDORES))
 
 # ──────────────────────────────────────────
 # FUNCIÓN QUE EJECUTA CADA HILO (corredor)
 # ──────────────────────────────────────────
-def correr(nombre: str):
+def correr(nombre: str, tiempos_paso: list):
     """Cada hilo llama a esta función con su propio corredor."""
 
-    for paso in range(1, DISTANCIA + 1):
-        time.sleep(random.uniform(0.1, 0.4))   # velocidad aleatoria
+    salida.wait()   # esperar en la línea de salida a los demás corredores
+
+    for paso, tiempo in enumerate(tiempos_paso, 1):
+        time.sleep(tiempo)   # velocidad aleatoria (sorteada antes de la salida)
         print(f"  {nombre}  paso {paso}/{DISTANCIA}")
 
     # ── SECCIÓN CRÍTICA ──────────────────────────────────────────────
     # Aquí usamos el lock porque `llegadas` es compartida entre hilos.
     # Sin esto, dos corredores podrían llegar "al mismo tiempo" y
     # registrarse con la misma posición → resultado incorrecto.
+    # El tiempo de llegada se toma DENTRO del lock: así el orden de los
+    # tiempos coincide siempre con el LUGAR # anunciado.
     with lock:
+        llegada  = time.perf_counter()
         posicion = len(llegadas) + 1
-        llegadas.append(nombre)
-        print(f"\n  ✅ {nombre} llegó en LUGAR #{posicion}\n")
+        llegadas.append((llegada, nombre))
     # ── FIN SECCIÓN CRÍTICA ──────────────────────────────────────────
 
+    print(f"\n  ✅ {nombre} llegó en LUGAR #{posicion}\n")
+
 
 # ──────────────────────────────────────────
 # PROGRAMA PRINCIPAL
@@ -59,9 +86,13 @@ def main():
     input("  Presiona ENTER para dar la salida... 🚦\n")
 
     # ── CREAR UN HILO POR CORREDOR ───────────────────────────────────
+    # Los tiempos de cada paso se sortean aquí, en el hilo principal: así
+    # los corredores no compiten por el generador compartido de `random`
+    # (que tiene su propio lock interno) durante la carrera.
     hilos = []
     for nombre in CORREDORES:
-        hilo = threading.Thread(target=correr, args=(nombre,))
+        tiempos_paso = [random.uniform(0.1, 0.4) for _ in range(DISTANCIA)]
+        hilo = threading.Thread(target=correr, args=(nombre, tiempos_paso))
         hilos.append(hilo)
 
     # ── LANZAR TODOS A LA VEZ (¡aquí empieza la concurrencia!) ───────
@@ -76,11 +107,13 @@ def main():
         hilo.join()
 
     # ── RESULTADOS ───────────────────────────────────────────────────
+    # El ranking final se ordena por tiempo de llegada, ya sin hilos activos.
     duracion = time.time() - inicio
+    clasificacion = [nombre for _, nombre in sorted(llegadas)]
     print("=" * 50)
     print("   🏆 RESULTADOS FINALES")
     print("=" * 50)
-    for i, nombre in enumerate(llegadas, 1):
+    for i, nombre in enumerate(clasificacion, 1):
         medalla = {1: "🥇", 2: "🥈", 3: "🥉"}.get(i, f"  {i}.")
         print(f"  {medalla}  {nombre}")
 
@@ -3,15 +3,24 @@
 ==================================================
 
 Conceptos demostrados:
-  • threading.Event   → el director da la señal de apertura (NUEVO)
-  • threading.Thread  → cada médico trabaja en su propio hilo
-  • threading.Lock    → protege el registro de pacientes atendidos
-  • thread.join()     → esperar a que todos los médicos terminen su turno
+  • threading.Condition → el director avisa la apertura con notify_all (NUEVO)
+  • threading.Thread    → cada médico trabaja en su propio hilo
+  • threading.Lock      → evita que los mensajes de los médicos se mezclen
+                          (o el FastRLock de fastrlock, si está instalado)
+  • collections.deque   → registro compartido con .append() atómico (sin lock)
+  • thread.join()       → esperar a que todos los médicos terminen su turno
 """
 
 import threading
 import time
 import random
+from collections import deque
+
+# Lock opcional más rápido sin contención (pip install fastrlock)
+try:
+    from fastrlock.rlock import FastRLock as _Lock
+except ImportError:
+    from threading import Lock as _Lock
 
 # ──────────────────────────────────────────
 # DATOS DEL HOSPITAL
@@ -25,16 +34,23 @@ MEDICOS = [
 
 PACIENTES_POR_MEDICO = 3
 
-# ── EVENTO ────────────────────────────────────────────────────────────────────
-# Un Event tiene dos estados: "apagado" (por defecto) y "encendido".
-# Los hilos pueden llamar a .wait() para PAUSARSE hasta que el evento
-# se encienda. El director llama a .set() para encenderlo y liberar a todos.
-apertura_hospital = threading.Event()
+# ── CONDICIÓN + BANDERA ───────────────────────────────────────────────────────
+# La señal de apertura es un simple bool. La Condition lo protege y permite
+# que los médicos DUERMAN con .wait_for() hasta que el director lo cambie y
+# los despierte a todos con .notify_all().
+# (Un threading.Event hace lo mismo por dentro: bool + Condition; aquí lo
+#  escribimos a mano para ver las piezas y evitar su capa extra.)
+hospital_abierto  = False
+apertura_hospital = threading.Condition()
+
+# ── REGISTRO ──────────────────────────────────────────────────────────────────
+# Recurso compartido entre los hilos de los médicos. deque.append es atómico,
+# así que varios hilos pueden registrar atenciones sin necesidad de un lock.
+registro = deque()   # atenciones completadas
 
 # ── LOCK ──────────────────────────────────────────────────────────────────────
-# Protege `registro` — recurso compartido entre los hilos de los médicos.
-lock    = threading.Lock()
-registro = []   # lista de atenciones completadas
+# Solo ordena la salida por consola: un mensaje completo a la vez.
+print_lock = _Lock()
 
 
 # ──────────────────────────────────────────
@@ -43,21 +59,25 @@ registro = []   # lista de atenciones completadas
 def director():
     """
     El director espera unos segundos (revisión del hospital)
-    y luego enciende el evento para que los médicos puedan atender.
+    y luego abre el hospital y avisa a los médicos para que puedan atender.
     """
+    global hospital_abierto
+
     print("  🏢 Director: revisando que todo esté listo...")
     time.sleep(2)   # simula la revisión previa a la apertura
 
     print("\n  🏢 Director: ¡HOSPITAL ABIERTO! Los médicos pueden atender.\n")
 
-    # .set() enciende el evento → desbloquea todos los .wait() activos
-    apertura_hospital.set()
+    # Cambiar la bandera y avisar, ambos con la condición tomada
+    with apertura_hospital:
+        hospital_abierto = True
+        apertura_hospital.notify_all()   # despierta a TODOS los médicos
 
 
 # ──────────────────────────────────────────
 # FUNCIÓN DE CADA MÉDICO (un hilo por médico)
 # ──────────────────────────────────────────
-def atender_pacientes(medico: dict):
+def atender_pacientes(medico: dict, duraciones: list):
     """Cada hilo espera la señal del director y luego atiende sus pacientes."""
 
     nombre       = medico["nombre"]
@@ -66,22 +86,23 @@ def atender_pacientes(medico: dict):
 
     print(f"  {emoji} {nombre} ({especialidad}): esperando apertura...")
 
-    # ── ESPERAR EL EVENTO ────────────────────────────────────────────
-    # .wait() pausa este hilo hasta que apertura_hospital.set() sea llamado.
-    # Todos los médicos están bloqueados aquí al mismo tiempo.
-    apertura_hospital.wait()
+    # ── ESPERAR LA APERTURA ──────────────────────────────────────────
+    # .wait_for() duerme este hilo hasta que `hospital_abierto` sea True.
+    # Si el hospital ya abrió antes de llegar aquí, no espera nada.
+    with apertura_hospital:
+        apertura_hospital.wait_for(lambda: hospital_abierto)
     # ────────────────────────────────────────────────────────────────
 
     print(f"  {emoji} {nombre}: ¡recibí la señal! Comenzando consultas.")
 
-    for i in range(1, PACIENTES_POR_MEDICO + 1):
-        duracion = random.uniform(0.5, 1.5)
+    for i, duracion in enumerate(duraciones, 1):
         time.sleep(duracion)   # simula la consulta médica
 
+        registro.append(f"{nombre} → Paciente {i}")   # atómico, sin lock
+
         # ── SECCIÓN CRÍTICA ──────────────────────────────────────────
-        # Solo un hilo a la vez puede actualizar el registro.
-        with lock:
-            registro.append(f"{nombre} → Paciente {i}")
+        # Solo un hilo a la vez puede escribir en la consola.
+        with print_lock:
             print(f"  {emoji} {nombre}: atendió paciente {i}/{PACIENTES_POR_MEDICO} "
                   f"({duracion:.1f}s)  | Total atendidos hoy: {len(registro)}")
         # ── FIN SECCIÓN CRÍTICA ──────────────────────────────────────
@@ -94,32 +115,36 @@ def atender_pacientes(medico: dict):
 # ──────────────────────────────────────────
 def main():
     print("=" * 55)
-    print("   🏥 SIMULADOR DE HOSPITAL — threading.Event")
+    print("   🏥 SIMULADOR DE HOSPITAL — threading.Condition")
     print("=" * 55)
     print(f"\n  Médicos disponibles : {len(MEDICOS)}")
     print(f"  Pacientes por médico: {PACIENTES_POR_MEDICO}")
     print(f"  Total de atenciones : {len(MEDICOS) * PACIENTES_POR_MEDICO}")
     print("\n  ¿Cómo funciona?")
-    print("  → Cada médico (hilo) espera con .wait()")
-    print("  → El director llama a .set() y los desbloquea a todos\n")
+    print("  → Cada médico (hilo) espera con .wait_for()")
+    print("  → El director llama a .notify_all() y los despierta a todos\n")
     input("  Presiona ENTER para abrir el hospital... 🚪\n")
 
     # ── CREAR HILOS ──────────────────────────────────────────────────
     hilo_director = threading.Thread(target=director, name="Director")
 
+    # La duración de cada consulta se sortea aquí, en el hilo principal:
+    # los médicos no comparten el generador de `random` (ni su lock interno).
     hilos_medicos = [
-        threading.Thread(target=atender_pacientes, args=(m,), name=m["nombre"])
+        threading.Thread(
+            target=atender_pacientes,
+            args=(m, [random.uniform(0.5, 1.5) for _ in range(PACIENTES_POR_MEDICO)]),
+            name=m["nombre"],
+        )
         for m in MEDICOS
     ]
 
     # ── LANZAR HILOS ─────────────────────────────────────────────────
-    # Primero los médicos (quedarán bloqueados en .wait())
+    # Primero los médicos (quedarán dormidos en .wait_for())
     for hilo in hilos_medicos:
         hilo.start()
 
-    time.sleep(0.3)  # dar tiempo a que todos lleguen al .wait()
-
-    # Luego el director (quien eventualmente llamará a .set())
+    # Luego el director (quien eventualmente llamará a .notify_all())
     hilo_director.start()
 
     # ── ESPERAR A TODOS ───────────────────────────────────────────────
@@ -132,12 +157,13 @@ def main():
     print("   📋 RESUMEN DEL TURNO")
     print("=" * 55)
     print(f"  Pacientes atendidos en total: {len(registro)}")
-    print(f"  Estado del evento al cerrar: "
-          f"{'🟢 activo' if apertura_hospital.is_set() else '🔴 apagado'}")
+    print(f"  Estado del hospital al cerrar: "
+          f"{'🟢 abierto' if hospital_abierto else '🔴 cerrado'}")
     print("\n  Conceptos usados:")
-    print("   • threading.Event  → .wait() bloqueó los hilos hasta .set()")
-    print("   • threading.Lock   → registro compartido sin conflictos")
-    print("   • thread.join()    → esperamos a cada médico antes de imprimir")
+    print("   • threading.Condition → .wait_for() durmió a los médicos hasta .notify_all()")
+    print("   • collections.deque   → registro compartido sin conflictos ni lock")
+    print("   • threading.Lock      → mensajes de consola sin mezclarse (o FastRLock)")
+    print("   • thread.join()       → esperamos a cada médico antes de imprimir")
     print("=" * 55)
 
 
@@ -1,17 +1,17 @@
 import asyncio
 import random
 
-async def consultar_api(nombre):
+async def consultar_api(nombre, tiempo):
     print(f"Consultando API: {nombre}")
-    tiempo = random.randint(1, 4)
     await asyncio.sleep(tiempo)
     print(f"Respuesta recibida de {nombre} en {tiempo} segundos")
 
 async def main():
-    await asyncio.gather(
-        consultar_api("Servicio 1"),
-        consultar_api("Servicio 2"),
-        consultar_api("Servicio 3")
-    )
+    servicios = ["Servicio 1", "Servicio 2", "Servicio 3"]
+    tiempos = [random.randint(1, 4) for _ in servicios]
+
+    async with asyncio.TaskGroup() as tg:
+        for servicio, tiempo in zip(servicios, tiempos):
+            tg.create_task(consultar_api(servicio, tiempo))
 
 asyncio.run(main())
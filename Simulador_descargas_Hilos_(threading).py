@@ -1,23 +1,16 @@
-import threading
 import time
 import random
+from concurrent.futures import ThreadPoolExecutor
 
-def descargar_archivo(nombre):
+def descargar_archivo(nombre, tiempo):
     print(f"Iniciando descarga: {nombre}")
-    tiempo = random.randint(2, 5)
     time.sleep(tiempo)
     print(f"Descarga completada: {nombre} en {tiempo} segundos")
 
 archivos = ["archivo1.zip", "archivo2.mp4", "archivo3.pdf"]
+tiempos = [random.randint(2, 5) for _ in archivos]
 
-hilos = []
-
-for archivo in archivos:
-    hilo = threading.Thread(target=descargar_archivo, args=(archivo,))
-    hilos.append(hilo)
-    hilo.start()
-
-for hilo in hilos:
-    hilo.join()
+with ThreadPoolExecutor(max_workers=min(32, len(archivos))) as executor:
+    list(executor.map(descargar_archivo, archivos, tiempos))
 
 print("Todas las descargas finalizaron.")
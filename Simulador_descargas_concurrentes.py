@@ -5,13 +5,17 @@
 ╚══════════════════════════════════════════════════════════════╝
 
 Conceptos demostrados:
-  - threading.Thread        → hilos paralelos
-  - threading.Lock          → exclusión mutua (evitar condiciones de carrera)
-  - concurrent.futures      → ThreadPoolExecutor para gestión de hilos
-  - threading.Event         → señales entre hilos
+  - ThreadPoolExecutor      → un pool global de hilos reutilizado por cada modo
+  - os.write                → escrituras atómicas en consola, sin lock
+  - concurrent.futures.wait → esperar a todas las descargas (o al primer fallo)
+  - threading.Semaphore     → máximo 3 descargas simultáneas en el modo pool
+  - asyncio.gather          → descargas concurrentes en un solo hilo
   - time comparativo        → secuencial vs concurrente
 """
 
+import asyncio
+import os
+import sys
 import threading
 import time
 import random
@@ -32,79 +36,168 @@ ARCHIVOS = [
 
 VELOCIDAD_MB_S = 120   # MB/s simulados (compartidos entre hilos)
 ANCHO_BARRA   = 30     # caracteres de la barra de progreso
+PASOS_POR_ESCRITURA = 5   # pasos de progreso por cada espera + escritura
+
+# Si la descarga hiciera trabajo de CPU real (p. ej. calcular el checksum de
+# cada archivo), los hilos no escalarían por el GIL: con CPU_INTENSIVO = True
+# el modo pool usa procesos (ProcessPoolExecutor), cada uno con su propio GIL.
+CPU_INTENSIVO = False
+
+# Todas las barras posibles (0..ANCHO_BARRA bloques) calculadas una sola vez:
+# en el bucle de progreso basta indexar, sin construir strings nuevos.
+_BARRAS = tuple("█" * k + "░" * (ANCHO_BARRA - k) for k in range(ANCHO_BARRA + 1))
 
 # ─────────────────────────────────────────────
-# LOCK COMPARTIDO — evita que los prints se mezclen
+# POOL GLOBAL DE HILOS — se crea una vez y se reutiliza en todos los modos
 # ─────────────────────────────────────────────
-print_lock = threading.Lock()
+# Crear y destruir un hilo por archivo en cada modo cuesta llamadas al sistema
+# y una pila nueva por hilo; con un pool persistente los hilos se reutilizan.
+_POOL_HILOS = concurrent.futures.ThreadPoolExecutor(
+    max_workers=min(len(ARCHIVOS), (os.cpu_count() or 1) * 5),
+    thread_name_prefix="Hilo",
+)
 
-# Estadísticas compartidas (protegidas por lock)
-estadisticas = {"total_mb": 0, "archivos_completados": 0}
-stats_lock = threading.Lock()
+# ─────────────────────────────────────────────
+# SALIDA SIN LOCK — evita que los prints se mezclen
+# ─────────────────────────────────────────────
+# Cada línea de progreso se escribe con UNA llamada a os.write() sobre el
+# descriptor de la consola. Solo en pipes garantiza el kernel que una
+# escritura de hasta PIPE_BUF bytes (4 KB en Linux) no se intercala con otra;
+# en una terminal o un archivo no hay garantía formal, pero una escritura
+# corta sale entera en la práctica. Por eso escribimos línea a línea, nunca
+# bloques grandes, y así los hilos no mezclan sus salidas sin usar lock.
+def _escribir(texto: str):
+    """Escribe `texto` en la consola, en una sola llamada al sistema si se puede."""
+    try:
+        fd = sys.stdout.fileno()
+    except (AttributeError, OSError, ValueError):
+        # Sin descriptor real (IDLE, Jupyter, stdout redirigido a un StringIO)
+        sys.stdout.write(texto)
+        sys.stdout.flush()
+        return
+
+    datos = memoryview(texto.encode(sys.stdout.encoding or "utf-8", errors="replace"))
+    while datos:
+        datos = datos[os.write(fd, datos):]   # por si el kernel escribe solo una parte
 
 
 # ─────────────────────────────────────────────
-# FUNCIÓN DE DESCARGA SIMULADA
+# PLAN DE DESCARGAS — se calcula UNA vez para todos los modos
 # ─────────────────────────────────────────────
-def descargar_archivo(archivo: dict, hilo_id: int, modo: str = "concurrente") -> dict:
-    """
-    Simula la descarga de un archivo.
-    
-    Técnicas de concurrencia usadas aquí:
-      • threading.Lock → print_lock garantiza salida limpia sin mezcla
-      • time.sleep()   → simula I/O (donde la concurrencia aporta más)
-      • stats_lock     → actualización segura de estadísticas compartidas
+def _planificar_descarga(archivo: dict) -> dict:
     """
-    nombre    = archivo["nombre"]
-    tamaño    = archivo["tamaño_mb"]
-    hilo_name = threading.current_thread().name  # nombre del hilo actual
+    Calcula cuánto tardará la descarga de `archivo` (su "carga de trabajo").
 
-    # Velocidad variable por hilo (simula red real)
+    Se llama una sola vez por archivo, antes de empezar, y todos los modos
+    reutilizan el mismo plan: así comparan exactamente el mismo trabajo y
+    los hilos no tienen que sortear nada mientras descargan.
+    """
+    # Velocidad variable por archivo (simula red real)
     velocidad = VELOCIDAD_MB_S / (random.uniform(0.8, 1.5))
-    duracion  = tamaño / velocidad
+    return {**archivo, "duracion_s": archivo["tamaño_mb"] / velocidad}
+
+
+# ─────────────────────────────────────────────
+# SIMULACIÓN DE UNA DESCARGA (común a hilos y asyncio)
+# ─────────────────────────────────────────────
+def _simular_descarga(archivo: dict, hilo_id: int, hilo_name: str, en_vivo: bool):
+    """
+    Generador con la lógica de una descarga simulada.
+
+    Cada `yield` devuelve cuántos segundos hay que esperar a la "red"; quien
+    lo recorre decide CÓMO esperar (time.sleep en hilos, asyncio.sleep en
+    corrutinas). Al terminar devuelve el dict con el resultado.
+
+    El inicio y el final se escriben siempre, cada uno en su momento. La
+    barra de progreso (que se reescribe con "\\r") solo se muestra con
+    `en_vivo`: con varias descargas a la vez se pisarían unas a otras.
+    """
+    nombre   = archivo["nombre"]
+    tamaño   = archivo["tamaño_mb"]
+    duracion = archivo["duracion_s"]   # calculada en _planificar_descarga
 
     inicio = time.time()
 
-    with print_lock:
-        color = _color_hilo(hilo_id)
-        print(f"\n{color}  [{hilo_name}] ▶ Iniciando: {nombre} ({tamaño} MB)\033[0m")
+    # Color y prefijo de la línea se calculan una sola vez por archivo
+    color    = _color_hilo(hilo_id)
+    etiqueta = f"\r{color}  [{hilo_name}] {nombre[:22]:<22} "
+
+    _escribir(f"\n{color}  [{hilo_name}] ▶ Iniciando: {nombre} ({tamaño} MB)\033[0m\n")
 
-    # Simular descarga en pasos
+    # Simular descarga en pasos, agrupados en lotes de PASOS_POR_ESCRITURA:
+    # UNA espera y UNA línea de progreso por lote (no una por paso), con la
+    # velocidad media real hasta ese momento.
+    # → 4 esperas y 4 escrituras por archivo en lugar de 20.
     pasos = 20
-    for paso in range(1, pasos + 1):
-        time.sleep(duracion / pasos)
-        porcentaje = int((paso / pasos) * 100)
-        bloques    = int((paso / pasos) * ANCHO_BARRA)
-        barra      = "█" * bloques + "░" * (ANCHO_BARRA - bloques)
-        velocidad_actual = tamaño * (paso / pasos) / (time.time() - inicio + 0.001)
-
-        with print_lock:
-            color = _color_hilo(hilo_id)
-            print(
-                f"\r{color}  [{hilo_name}] {nombre[:22]:<22} "
-                f"[{barra}] {porcentaje:>3}% "
-                f"({velocidad_actual:.1f} MB/s)\033[0m",
-                end="", flush=True
-            )
+    for primero in range(1, pasos + 1, PASOS_POR_ESCRITURA):
+        ultimo = min(primero + PASOS_POR_ESCRITURA - 1, pasos)
+        yield duracion * (ultimo - primero + 1) / pasos
+        if not en_vivo:
+            continue   # nadie vería la barra: solo esperamos
+
+        porcentaje = int((ultimo / pasos) * 100)
+        bloques    = int((ultimo / pasos) * ANCHO_BARRA)
+        barra      = _BARRAS[bloques]
+        velocidad_actual = tamaño * (ultimo / pasos) / (time.time() - inicio + 0.001)
+
+        _escribir(
+            f"{etiqueta}[{barra}] {porcentaje:>3}% "
+            f"({velocidad_actual:.1f} MB/s)\033[0m"
+        )
 
     tiempo_total = time.time() - inicio
 
-    # Actualizar estadísticas (sección crítica protegida)
-    with stats_lock:
-        estadisticas["total_mb"]            += tamaño
-        estadisticas["archivos_completados"] += 1
-
-    with print_lock:
-        color = _color_hilo(hilo_id)
-        print(
-            f"\r{color}  [{hilo_name}] {nombre[:22]:<22} "
-            f"[{'█' * ANCHO_BARRA}] 100% ✓ "
-            f"({tiempo_total:.2f}s)\033[0m"
-        )
+    _escribir(
+        f"{etiqueta}[{_BARRAS[ANCHO_BARRA]}] 100% ✓ "
+        f"({tiempo_total:.2f}s)\033[0m\n"
+    )
 
     return {"nombre": nombre, "tamaño": tamaño, "tiempo": tiempo_total}
 
 
+# ─────────────────────────────────────────────
+# FUNCIÓN DE DESCARGA SIMULADA (hilos)
+# ─────────────────────────────────────────────
+def descargar_archivo(archivo: dict, hilo_id: int, modo: str = "concurrente") -> dict:
+    """
+    Simula la descarga de un archivo.
+    
+    Técnicas de concurrencia usadas aquí:
+      • os.write()     → cada línea sale en una sola escritura, sin lock
+      • time.sleep()   → simula I/O (donde la concurrencia aporta más)
+      • return dict    → sin estado compartido; se puede enviar a otro proceso
+    """
+    hilo_name  = threading.current_thread().name  # nombre del hilo actual
+    # Progreso en vivo solo si nadie más escribe a la vez (modo secuencial)
+    en_vivo    = modo == "secuencial"
+    simulacion = _simular_descarga(archivo, hilo_id, hilo_name, en_vivo)
+    try:
+        while True:
+            time.sleep(next(simulacion))   # bloquea SOLO este hilo
+    except StopIteration as fin:
+        return fin.value
+
+
+# ─────────────────────────────────────────────
+# FUNCIÓN DE DESCARGA SIMULADA (asyncio)
+# ─────────────────────────────────────────────
+async def descargar_archivo_async(archivo: dict, hilo_id: int) -> dict:
+    """
+    Simula la descarga de un archivo como corrutina.
+
+    Técnicas de concurrencia usadas aquí:
+      • await asyncio.sleep() → cede el event loop mientras "espera la red"
+      • sin locks             → un solo hilo; nadie interrumpe entre dos awaits
+    """
+    tarea_name = asyncio.current_task().get_name()
+    simulacion = _simular_descarga(archivo, hilo_id, tarea_name, en_vivo=False)
+    try:
+        while True:
+            await asyncio.sleep(next(simulacion))   # las demás tareas avanzan
+    except StopIteration as fin:
+        return fin.value
+
+
 # ─────────────────────────────────────────────
 # COLORES ANSI para diferenciar hilos visualmente
 # ─────────────────────────────────────────────
@@ -124,18 +217,16 @@ def _color_hilo(hilo_id: int) -> str:
 # ─────────────────────────────────────────────
 # MODO SECUENCIAL (sin concurrencia)
 # ─────────────────────────────────────────────
-def modo_secuencial():
+def modo_secuencial(descargas: list):
     print("\n\033[1m\033[97m" + "═" * 60)
     print("  MODO SECUENCIAL (sin concurrencia)")
     print("  Los archivos se descargan UNO A LA VEZ")
-    print("═" * 60 + "\033[0m")
+    print("═" * 60 + "\033[0m", flush=True)
 
-    estadisticas["total_mb"] = 0
-    estadisticas["archivos_completados"] = 0
     resultados = []
 
     inicio = time.time()
-    for i, archivo in enumerate(ARCHIVOS):
+    for i, archivo in enumerate(descargas):
         res = descargar_archivo(archivo, i, modo="secuencial")
         resultados.append(res)
 
@@ -145,41 +236,32 @@ def modo_secuencial():
 
 
 # ─────────────────────────────────────────────
-# MODO CONCURRENTE con threading.Thread
+# MODO CONCURRENTE con el pool global y concurrent.futures.wait
 # ─────────────────────────────────────────────
-def modo_threads():
+def modo_threads(descargas: list):
     print("\n\033[1m\033[97m" + "═" * 60)
-    print("  MODO CONCURRENTE — threading.Thread")
-    print("  Cada archivo se descarga en su PROPIO HILO")
-    print("═" * 60 + "\033[0m")
-
-    estadisticas["total_mb"] = 0
-    estadisticas["archivos_completados"] = 0
-    resultados = []
-    resultados_lock = threading.Lock()
+    print("  MODO CONCURRENTE — todas las descargas a la vez")
+    print("  Cada archivo se envía a un hilo del pool global")
+    print("═" * 60 + "\033[0m", flush=True)
 
-    def tarea(archivo, idx):
-        res = descargar_archivo(archivo, idx)
-        with resultados_lock:
-            resultados.append(res)
-
-    # ★ Crear y lanzar hilos
-    hilos = []
+    # ★ Lanzar todas las descargas en el pool global (hilos ya creados)
     inicio = time.time()
+    futures = [
+        _POOL_HILOS.submit(descargar_archivo, archivo, i)
+        for i, archivo in enumerate(descargas)
+    ]
 
-    for i, archivo in enumerate(ARCHIVOS):
-        hilo = threading.Thread(
-            target=tarea,
-            args=(archivo, i),
-            name=f"Hilo-{i+1}",  # nombre descriptivo
-            daemon=True
-        )
-        hilos.append(hilo)
-        hilo.start()  # ← lanzar hilo
+    # ★ Esperar a que TODAS las descargas terminen… o a la PRIMERA que falle
+    hechos, pendientes = concurrent.futures.wait(
+        futures, return_when=concurrent.futures.FIRST_EXCEPTION
+    )
+    for future in pendientes:
+        future.cancel()   # las que aún no empezaron ya no se ejecutan;
+                          # las que ya corren no se pueden parar y terminan solas
 
-    # ★ Esperar a que TODOS los hilos terminen
-    for hilo in hilos:
-        hilo.join()
+    # future.result() devuelve el resultado en ESTE hilo (sin lock) o
+    # relanza aquí la excepción de la descarga que falló
+    resultados = [future.result() for future in hechos]
 
     tiempo_total = time.time() - inicio
     _mostrar_resumen("CONCURRENTE (threads)", resultados, tiempo_total)
@@ -189,22 +271,36 @@ def modo_threads():
 # ─────────────────────────────────────────────
 # MODO CONCURRENTE con ThreadPoolExecutor
 # ─────────────────────────────────────────────
-def modo_pool():
+def modo_pool(descargas: list):
     print("\n\033[1m\033[97m" + "═" * 60)
-    print("  MODO POOL — concurrent.futures.ThreadPoolExecutor")
-    print("  Pool de 3 hilos que procesan 6 archivos")
-    print("═" * 60 + "\033[0m")
-
-    estadisticas["total_mb"] = 0
-    estadisticas["archivos_completados"] = 0
+    if CPU_INTENSIVO:
+        print("  MODO POOL — concurrent.futures.ProcessPoolExecutor")
+    else:
+        print("  MODO POOL — ThreadPoolExecutor global + Semaphore(3)")
+    print("  Máximo 3 descargas a la vez para procesar 6 archivos")
+    print("═" * 60 + "\033[0m", flush=True)
+
+    if CPU_INTENSIVO:
+        # ★ 3 procesos: descargar_archivo es una función de módulo que recibe
+        #   y devuelve dicts simples, así que se puede enviar a otro proceso
+        executor = concurrent.futures.ProcessPoolExecutor(max_workers=3)
+        tarea    = descargar_archivo
+    else:
+        # ★ Un Semaphore(3) limita a 3 workers sin tener que crear otro pool
+        executor = _POOL_HILOS
+        limite   = threading.Semaphore(3)
+
+        def tarea(archivo, idx):
+            with limite:
+                return descargar_archivo(archivo, idx)
 
     inicio = time.time()
 
-    # ★ ThreadPoolExecutor gestiona automáticamente el pool
-    with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+    try:
+        # ★ El executor gestiona automáticamente sus workers
         futures = {
-            executor.submit(descargar_archivo, archivo, i): archivo
-            for i, archivo in enumerate(ARCHIVOS)
+            executor.submit(tarea, archivo, i): archivo
+            for i, archivo in enumerate(descargas)
         }
 
         resultados = []
@@ -215,9 +311,40 @@ def modo_pool():
             except Exception as e:
                 archivo = futures[future]
                 print(f"  Error descargando {archivo['nombre']}: {e}")
+    finally:
+        # El pool de procesos es solo de este modo: se cierra pase lo que pase
+        if executor is not _POOL_HILOS:
+            executor.shutdown()
 
     tiempo_total = time.time() - inicio
-    _mostrar_resumen("POOL (3 workers)", resultados, tiempo_total)
+    _mostrar_resumen("POOL (3 descargas simultáneas)", resultados, tiempo_total)
+    return tiempo_total
+
+
+# ─────────────────────────────────────────────
+# MODO CONCURRENTE con asyncio
+# ─────────────────────────────────────────────
+async def _descargas_async(descargas: list) -> list:
+    # ★ Una tarea por archivo, todas en el MISMO hilo (event loop)
+    tareas = [
+        asyncio.create_task(descargar_archivo_async(archivo, i), name=f"Tarea-{i+1}")
+        for i, archivo in enumerate(descargas)
+    ]
+    # ★ gather espera a que TODAS terminen y devuelve sus resultados en orden
+    return await asyncio.gather(*tareas)
+
+
+def modo_asyncio(descargas: list):
+    print("\n\033[1m\033[97m" + "═" * 60)
+    print("  MODO ASYNCIO — asyncio.gather")
+    print("  Todas las descargas en UN SOLO HILO (event loop)")
+    print("═" * 60 + "\033[0m", flush=True)
+
+    inicio = time.time()
+    resultados = asyncio.run(_descargas_async(descargas))
+
+    tiempo_total = time.time() - inicio
+    _mostrar_resumen("ASYNCIO (1 hilo)", resultados, tiempo_total)
     return tiempo_total
 
 
@@ -225,6 +352,8 @@ def modo_pool():
 # RESUMEN FINAL
 # ─────────────────────────────────────────────
 def _mostrar_resumen(modo: str, resultados: list, tiempo_total: float):
+    # Todo sale de lo que DEVUELVE cada descarga: los workers no comparten
+    # estado mutable, así que vale igual con hilos, corrutinas o procesos.
     total_mb = sum(r["tamaño"] for r in resultados)
     throughput = total_mb / tiempo_total if tiempo_total > 0 else 0
 
@@ -240,18 +369,19 @@ def _mostrar_resumen(modo: str, resultados: list, tiempo_total: float):
 # ─────────────────────────────────────────────
 # COMPARACIÓN FINAL
 # ─────────────────────────────────────────────
-def mostrar_comparacion(t_seq, t_threads, t_pool):
+def mostrar_comparacion(t_seq, t_threads, t_pool, t_async):
     print("\n\033[1m\033[97m" + "═" * 60)
     print("  📊 COMPARACIÓN DE RENDIMIENTO")
-    print("═" * 60 + "\033[0m")
+    print("═" * 60 + "\033[0m", flush=True)
 
     datos = [
         ("Secuencial",       t_seq,     "\033[91m"),
         ("Threads paralelos", t_threads, "\033[92m"),
-        ("Pool (3 workers)", t_pool,    "\033[93m"),
+        ("Pool (3 simultáneas)", t_pool, "\033[93m"),
+        ("asyncio (1 hilo)", t_async,   "\033[96m"),
     ]
 
-    max_t = max(t_seq, t_threads, t_pool)
+    max_t = max(t_seq, t_threads, t_pool, t_async)
     for nombre, tiempo, color in datos:
         barra_len = int((tiempo / max_t) * 40)
         barra     = "█" * barra_len
@@ -260,11 +390,12 @@ def mostrar_comparacion(t_seq, t_threads, t_pool):
 
     print()
     print("\033[1m  💡 Conceptos demostrados:\033[0m")
-    print("   • threading.Thread    → hilos independientes por tarea")
-    print("   • threading.Lock      → sección crítica (print / estadísticas)")
-    print("   • ThreadPoolExecutor  → pool reutilizable con workers limitados")
+    print("   • ThreadPoolExecutor  → pool global de hilos, creado una sola vez")
+    print("   • os.write            → salida atómica sin lock (print de hilos)")
+    print("   • threading.Semaphore → como mucho 3 descargas simultáneas en el pool")
     print("   • concurrent.futures  → manejo de resultados asincrónicos")
-    print("   • thread.join()       → sincronización (esperar a todos)")
+    print("   • asyncio.gather      → corrutinas concurrentes sin hilos extra")
+    print("   • futures.wait()      → sincronización (esperar a todos o al primer fallo)")
     print()
 
 
@@ -275,29 +406,40 @@ def main():
     print("\033[1m\033[96m")
     print("╔══════════════════════════════════════════════════════════╗")
     print("║      🔀 SIMULADOR DE CONCURRENCIA EN PYTHON              ║")
-    print("║         threading · ThreadPoolExecutor · Lock            ║")
+    print("║       threading · ThreadPoolExecutor · asyncio           ║")
     print("╚══════════════════════════════════════════════════════════╝")
     print(f"\033[0m  Iniciado: {datetime.now().strftime('%H:%M:%S')}")
     print(f"  Hilos disponibles: Python puede crear múltiples threads")
     print(f"  Archivos a descargar: {len(ARCHIVOS)}")
 
-    print("\n\033[33m  [!] Comparando: secuencial vs threads vs pool...\033[0m")
+    print("\n\033[33m  [!] Comparando: secuencial vs threads vs pool vs asyncio...\033[0m")
     input("\n  Presiona ENTER para comenzar la demostración...\n")
 
-    # 1. Secuencial
-    t_seq = modo_secuencial()
-    time.sleep(0.5)
+    # Misma carga de trabajo para todos los modos → comparación justa
+    descargas = [_planificar_descarga(archivo) for archivo in ARCHIVOS]
+
+    try:
+        # 1. Secuencial
+        t_seq = modo_secuencial(descargas)
+        time.sleep(0.5)
+
+        # 2. Threads en paralelo
+        t_threads = modo_threads(descargas)
+        time.sleep(0.5)
 
-    # 2. Threads en paralelo
-    t_threads = modo_threads()
-    time.sleep(0.5)
+        # 3. Pool de workers
+        t_pool = modo_pool(descargas)
+        time.sleep(0.5)
 
-    # 3. Pool de workers
-    t_pool = modo_pool()
-    time.sleep(0.5)
+        # 4. asyncio en un solo hilo
+        t_async = modo_asyncio(descargas)
+        time.sleep(0.5)
 
-    # Comparación final
-    mostrar_comparacion(t_seq, t_threads, t_pool)
+        # Comparación final
+        mostrar_comparacion(t_seq, t_threads, t_pool, t_async)
+    finally:
+        # Aunque un modo falle: descarta lo que quede en cola y cierra el pool
+        _POOL_HILOS.shutdown(cancel_futures=True)
 
 
 if __name__ == "__main__":